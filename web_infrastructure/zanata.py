@@ -56,6 +56,9 @@ options:
     required: true
     description:
       - Zanata project id.
+      - For the read-only operations (detail, stats, config) this may be
+        a comma-separated list of project ids; the requests are then
+        issued concurrently and the result is a dict keyed by project id.
 
   project_name:
     required: false
@@ -81,8 +84,33 @@ options:
     description:
      - Zanata project version
 
+  cache_ttl:
+    required: false
+    description:
+     - Seconds for which responses of the read-only operations (detail,
+       stats, config) are cached by the persistent-pool agent and
+       reused instead of repeating the request. 0 disables caching.
+       Only effective together with I(persistent_pool), since each
+       module run is otherwise a fresh process with nothing cached.
+    default: 0
+
+  persistent_pool:
+    required: false
+    choices: [ 'yes', 'no' ]
+    description:
+     - Proxy REST calls through a small per-user agent process that
+       holds the connection pool open between tasks, so consecutive
+       zanata tasks in a play reuse one TLS connection. The agent is
+       started on first use and exits after five idle minutes.
+    default: 'no'
+
 notes:
   - "Write operations would require Zanata API key."
+  - "This module requires Python 2.6 or later on the target."
+  - "If the C(httpx) library is installed (with its C(h2) extra), REST
+     calls share one HTTP/2 connection and batched lookups multiplex
+     over it; failing that C(requests) provides a keep-alive connection,
+     and without either each call opens a new one."
 
 """
 
@@ -140,7 +168,13 @@ Zanata project details, stats json
 Zanata project config xml
 """
 
-import sys
+import base64
+import os
+import socket
+import stat
+import tempfile
+import threading
+import time
 
 try:
     import json
@@ -151,101 +185,547 @@ except ImportError:
         # let module_utils/basic.py raise an error here
         pass
 
-from ansible.module_utils.basic import *
-from ansible.module_utils.urls import *
-from ansible.module_utils.pycompat24 import get_exception
+# orjson decodes large stats payloads several times faster than the
+# stdlib parser; fall back to whichever json module was imported above
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
 
+# stdlib json.loads only learned to take bytes/bytearray in Python
+# 3.6; older decoders need the buffer turned into text first
+try:
+    _loads(bytearray(b'{}'))
+except TypeError:
+    _LOADS_WANTS_TEXT = True
+else:
+    _LOADS_WANTS_TEXT = False
 
-def rest_call(url, user=None, token=None, data=None, method=None, op=None):
-    headers = {
-        'Accept': 'application/json',
-        'Content-Type': 'application/json',
-    }
-    if user and token:
-        headers.update({
-            'X-Auth-User': user, 'X-Auth-Token': token
-        })
 
-    if data:
-        data = json.dumps(data)
+def _loads_raw(raw):
+    if _LOADS_WANTS_TEXT:
+        raw = bytes(raw).decode('utf-8')
+    return _loads(raw)
 
-    if op == 'config':
-        headers['Accept'] = 'application/xml'
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    HAS_REQUESTS = False
+else:
+    HAS_REQUESTS = True
 
-    module.params['follow_redirects'] = True
-    response, info = fetch_url(module, url, data=data,
-                               method=method, headers=headers)
+try:
+    import httpx
+except ImportError:
+    HAS_HTTPX = False
+else:
+    HAS_HTTPX = True
 
-    if info['status'] not in (200, 201, 204):
-        module.fail_json(msg=info['msg'])
-    elif info['status'] == 201 and op == 'create':
-        return 'Creation successful!'
-    elif info['status'] == 200 and op == 'modify':
-        return 'Modification successful!'
+from ansible.module_utils.basic import *
+from ansible.module_utils.urls import *
+from ansible.module_utils.pycompat24 import get_exception
 
-    body = response.read()
 
-    if body and op == 'config':
-        return body
-    elif body:
-        return json.loads(body)
+# Seconds before an unresponsive server fails the call, on every
+# transport (matches the fetch_url default)
+_REQUEST_TIMEOUT = 10
+
+# A single keep-alive session shared by all rest_call invocations, so
+# that consecutive Zanata REST calls within one module run reuse the
+# same TCP/TLS connection instead of paying a handshake per request.
+if HAS_REQUESTS:
+    _SESSION = requests.Session()
+    _SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    _SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    _SESSION.headers.update({
+        'Connection': 'keep-alive', 'Keep-Alive': 'timeout=60'
+    })
+else:
+    _SESSION = None
+
+# Preferred over the requests session when available: with HTTP/2 the
+# concurrent batch lookups multiplex as streams over a single TLS
+# connection instead of queueing request/response pairs on one socket.
+if HAS_HTTPX:
+    # httpx raises the missing-h2 ImportError lazily inside the first
+    # request that negotiates h2, not at client construction, so probe
+    # for the h2 package directly; without it, HTTP/1.1 keep-alive
+    try:
+        import h2
+    except ImportError:
+        HAS_H2 = False
     else:
-        return {}
+        HAS_H2 = True
+    _HTTPX_SESSION = httpx.Client(
+        http2=HAS_H2, follow_redirects=True,
+        timeout=_REQUEST_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=8,
+                            keepalive_expiry=60))
+else:
+    _HTTPX_SESSION = None
+
+
+# Default header sets, shared by all calls and copied before any
+# per-call auth headers are added
+_BASE_HEADERS_JSON = {
+    'Accept': 'application/json',
+    'Content-Type': 'application/json',
+}
+_BASE_HEADERS_XML = {
+    'Accept': 'application/xml',
+    'Content-Type': 'application/json',
+}
+
+# URL path templates per operation, filled in from module params
+_DETAIL_PATH = '/projects/p/{project_id}'
+_VERSION_PATH = '/project/{project_id}/version/{version}'
+_STATS_PATH = '/stats/proj/{project_id}/iter/{version}'
+_CONFIG_PATH = '/project/{project_id}/version/{version}/config'
+
+# (body key, module param) pairs making up the create_project payload
+_CREATE_PROJECT_BODY_MAP = (
+    ('name', 'project_name'), ('id', 'project_id'),
+    ('description', 'description'), ('type', 'type'),
+)
+
+# Replies to idempotent GETs, keyed on (url, op) as (timestamp, reply).
+# Lives in the sidecar agent, the only process that survives between
+# module invocations; consulted when a request carries a positive
+# cache_ttl. The agent serves connections on threads, hence the lock.
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# TTL arithmetic should not go backwards with the wall clock;
+# time.monotonic is Python 3 only, hence the fallback
+_monotonic = getattr(time, 'monotonic', time.time)
+
+
+# Chunk size for incremental body reads
+_READ_CHUNK = 65536
+
+# Seconds without a request after which the sidecar agent exits
+_AGENT_IDLE_TIMEOUT = 300
+
+# Seconds the agent will wait on one accepted connection before giving
+# up on it; keeps a silent peer from wedging the single-threaded agent
+_AGENT_IO_TIMEOUT = 30
+
+
+class ZanataRestException(Exception):
+    """Raised when a Zanata REST call fails; turned into fail_json in main()."""
+    pass
+
+
+def _read_body(response):
+    # Accumulate the body in fixed-size chunks rather than one big
+    # read(), which keeps peak memory bounded while a large stats
+    # payload arrives. Handles both requests and fetch_url responses.
+    # Returned as the bytearray itself: a bytes() round-trip would
+    # recreate the full-size second buffer this is meant to avoid, and
+    # the consumers (json decode, base64) take a bytearray as is.
+    chunks = bytearray()
+    if hasattr(response, 'iter_bytes'):
+        # httpx
+        for chunk in response.iter_bytes(_READ_CHUNK):
+            chunks.extend(chunk)
+    elif hasattr(response, 'iter_content'):
+        # requests
+        for chunk in response.iter_content(_READ_CHUNK):
+            chunks.extend(chunk)
+    else:
+        while True:
+            chunk = response.read(_READ_CHUNK)
+            if not chunk:
+                break
+            chunks.extend(chunk)
+    return chunks
+
+
+def _http_request(method, url, data=None, headers=None):
+    # Perform one HTTP exchange over the best available transport and
+    # return (status, error message, body bytes or None on failure).
+    if _HTTPX_SESSION is not None:
+        try:
+            request = _HTTPX_SESSION.build_request(method, url, content=data,
+                                                   headers=headers)
+            response = _HTTPX_SESSION.send(request, stream=True)
+        except httpx.HTTPError:
+            e = get_exception()
+            raise ZanataRestException(str(e))
+        status = response.status_code
+        error_msg = 'HTTP Error %s: %s' % (status, response.reason_phrase)
+        try:
+            if status in (200, 201, 204):
+                body = _read_body(response)
+            else:
+                body = None
+        finally:
+            response.close()
+    elif HAS_REQUESTS:
+        try:
+            response = _SESSION.request(method, url, data=data,
+                                        headers=headers, allow_redirects=True,
+                                        stream=True, timeout=_REQUEST_TIMEOUT)
+        except requests.RequestException:
+            e = get_exception()
+            raise ZanataRestException(str(e))
+        status = response.status_code
+        error_msg = 'HTTP Error %s: %s' % (status, response.reason)
+        if status in (200, 201, 204):
+            body = _read_body(response)
+        else:
+            response.close()
+            body = None
+    else:
+        module.params['follow_redirects'] = True
+        response, info = fetch_url(module, url, data=data,
+                                   method=method, headers=headers,
+                                   timeout=_REQUEST_TIMEOUT)
+        status = info['status']
+        error_msg = info['msg']
+        if status in (200, 201, 204):
+            body = _read_body(response)
+        else:
+            body = None
+    return status, error_msg, body
+
+
+def _agent_socket_path():
+    # Keep the socket inside a private per-uid directory, the
+    # ssh-agent pattern: the tempdir fallback is world-writable, so a
+    # bare well-known socket name there could be pre-bound by another
+    # user, who would then receive our auth headers. Verify the
+    # directory really is ours and closed off before trusting it.
+    run_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    agent_dir = os.path.join(run_dir, 'zanata-agent-%d' % os.getuid())
+    try:
+        os.mkdir(agent_dir, 0o700)
+    except OSError:
+        # already exists, or unusable; the checks below decide
+        pass
+    dir_stat = os.lstat(agent_dir)
+    if (not stat.S_ISDIR(dir_stat.st_mode)
+            or dir_stat.st_uid != os.getuid()
+            or dir_stat.st_mode & 0o077):
+        raise ZanataRestException(
+            'refusing to use %s: not a private directory owned by uid %d'
+            % (agent_dir, os.getuid()))
+    return os.path.join(agent_dir, 'agent.sock')
+
+
+def _recv_all(sock):
+    chunks = bytearray()
+    while True:
+        chunk = sock.recv(_READ_CHUNK)
+        if not chunk:
+            break
+        chunks.extend(chunk)
+    return bytes(chunks)
+
+
+def _agent_alive(sock_path):
+    # A connect probe is the only reliable liveness test; the socket
+    # file existing says nothing about whether its agent still runs.
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            probe.connect(sock_path)
+        except socket.error:
+            return False
+        return True
+    finally:
+        probe.close()
 
 
-def create_project(base_url, params, op_modify=False):
-    body = {
-        "name": params['project_name'], "id": params['project_id'],
-        "description": params['description'], "type": params['type']
-    }
-    zanata_user = params['username']
-    api_key = params['token']
-    url = base_url + '/projects/p/' + params['project_id']
-    operation = 'create'
-    if op_modify:
-        operation = 'modify'
-    return rest_call(
-        url, user=zanata_user, token=api_key, data=body,
-        method='PUT', op=operation
-    )
+def _agent_handle(conn):
+    # Serve one envelope on one accepted connection.
+    try:
+        # accept() does not inherit the listener's timeout
+        conn.settimeout(_AGENT_IO_TIMEOUT)
+        try:
+            envelope = _loads_raw(_recv_all(conn))
+            method = envelope['method']
+            url = envelope['url']
+            cache_ttl = envelope.get('cache_ttl') or 0
+            cache_key = (url, envelope.get('op'))
+            reply = None
+            if method == 'GET' and cache_ttl > 0:
+                _CACHE_LOCK.acquire()
+                try:
+                    cached = _CACHE.get(cache_key)
+                finally:
+                    _CACHE_LOCK.release()
+                if cached and _monotonic() - cached[0] < cache_ttl:
+                    reply = cached[1]
+            if reply is None:
+                status, error_msg, body = _http_request(
+                    method, url, data=envelope.get('data'),
+                    headers=envelope.get('headers'))
+                if body:
+                    body = base64.b64encode(body).decode('ascii')
+                else:
+                    body = ''
+                reply = dict(status=status, msg=error_msg, body=body)
+                _CACHE_LOCK.acquire()
+                try:
+                    if method != 'GET':
+                        # a write makes cached GETs for the URL stale
+                        for key in list(_CACHE):
+                            if key[0] == url:
+                                del _CACHE[key]
+                    elif cache_ttl > 0 and status in (200, 201, 204):
+                        _CACHE[cache_key] = (_monotonic(), reply)
+                finally:
+                    _CACHE_LOCK.release()
+        except Exception:
+            e = get_exception()
+            reply = dict(status=-1, msg=str(e), body='')
+        reply = _dumps(reply)
+        if not isinstance(reply, bytes):
+            reply = reply.encode('utf-8')
+        try:
+            conn.sendall(reply)
+        except socket.error:
+            # peer went away; nobody left to answer, carry on
+            pass
+    finally:
+        conn.close()
+
+
+def _agent_serve(sock_path):
+    # Body of the sidecar agent: answer request envelopes over a unix
+    # socket, performing the real REST calls on this process' shared
+    # session so TLS connections survive across ansible task runs.
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # the tempdir fallback for the socket directory is world-readable,
+    # so never rely on the caller's umask to keep the socket private
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(sock_path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(sock_path, 0o600)
+    bound_stat = os.stat(sock_path)
+    # the backlog must absorb a whole batch fan-out arriving at once
+    server.listen(64)
+    server.settimeout(_AGENT_IDLE_TIMEOUT)
+    try:
+        while True:
+            try:
+                conn, _client = server.accept()
+            except socket.timeout:
+                # nobody has talked to us for a while; shut down
+                break
+            # one thread per connection: the sessions are thread-safe,
+            # and a serialized agent would undo the batch fan-out that
+            # funnels into it (and could outwait the clients' connect
+            # deadline on large batches)
+            handler = threading.Thread(target=_agent_handle, args=(conn,))
+            handler.daemon = True
+            handler.start()
+    finally:
+        server.close()
+        # only remove the path if it still refers to our own socket; a
+        # successor agent may have replaced it in the meantime
+        try:
+            path_stat = os.stat(sock_path)
+            if ((path_stat.st_dev, path_stat.st_ino) ==
+                    (bound_stat.st_dev, bound_stat.st_ino)):
+                os.unlink(sock_path)
+        except OSError:
+            pass
+
+
+def _spawn_agent(sock_path):
+    # Spawning is serialized through an exclusive lock file so that two
+    # concurrent first-users cannot fork duplicate agents or unlink the
+    # socket one of them has just bound.
+    lock_path = sock_path + '.lock'
+    try:
+        lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except OSError:
+        # someone else is spawning right now; their agent will serve
+        # us, unless their lock is a leftover of a crash
+        try:
+            if time.time() - os.stat(lock_path).st_mtime > 30:
+                os.unlink(lock_path)
+        except OSError:
+            pass
+        return
+    try:
+        if _agent_alive(sock_path):
+            return
+        # only ever remove a socket nobody answers on
+        try:
+            os.unlink(sock_path)
+        except OSError:
+            pass
+        pid = os.fork()
+        if pid:
+            os.waitpid(pid, 0)
+            return
+        # double-fork so the agent is reparented to init and outlives
+        # the module process; stdio goes to devnull so the agent can
+        # never pollute the module's JSON output
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        os.close(lock_fd)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull, 0)
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        try:
+            _agent_serve(sock_path)
+        finally:
+            os._exit(0)
+    finally:
+        os.close(lock_fd)
+        try:
+            os.unlink(lock_path)
+        except OSError:
+            pass
+
+
+def _agent_request(method, url, data, headers, op):
+    # Proxy one REST call through the long-lived sidecar agent,
+    # starting it on first use.
+    sock_path = _agent_socket_path()
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    envelope = _dumps(dict(method=method, url=url, data=data,
+                           headers=headers, op=op,
+                           cache_ttl=module.params.get('cache_ttl') or 0))
+    if not isinstance(envelope, bytes):
+        envelope = envelope.encode('utf-8')
+
+    client = None
+    spawned = False
+    deadline = time.time() + 5
+    while True:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(sock_path)
+            break
+        except socket.error:
+            client.close()
+            if not spawned:
+                _spawn_agent(sock_path)
+                spawned = True
+            elif time.time() > deadline:
+                raise ZanataRestException(
+                    'cannot reach zanata agent at %s' % sock_path)
+            time.sleep(0.05)
+    try:
+        client.sendall(envelope)
+        client.shutdown(socket.SHUT_WR)
+        reply = _loads_raw(_recv_all(client))
+    finally:
+        client.close()
 
+    if reply['status'] == -1:
+        raise ZanataRestException(reply['msg'])
+    body = base64.b64decode(reply['body']) if reply['body'] else None
+    return reply['status'], reply['msg'], body
 
-def modify(base_url, params):
-    create_project(base_url, params, op_modify=True)
 
+def rest_call(url, user=None, token=None, data=None, method=None, op=None):
+    headers = (_BASE_HEADERS_XML if op == 'config'
+               else _BASE_HEADERS_JSON).copy()
+    if user and token:
+        headers['X-Auth-User'] = user
+        headers['X-Auth-Token'] = token
 
-def create_version(base_url, params):
-    body = {"id": params['version']}
-    zanata_user = params['username']
-    api_key = params['token']
-    url = base_url + '/project/' + params['project_id'] + \
-          '/version/' + params['version']
-    return rest_call(url, user=zanata_user, token=api_key,
-                     data=body, method='PUT', op='create')
+    if data:
+        data = _dumps(data)
 
+    if module.params.get('persistent_pool') and hasattr(socket, 'AF_UNIX'):
+        status, error_msg, body = _agent_request(method, url, data,
+                                                 headers, op)
+    else:
+        status, error_msg, body = _http_request(method, url, data, headers)
 
-def stats(base_url, params):
-    url = base_url + '/stats/proj/' + params['project_id'] + \
-          '/iter/' + params['version']
-    if params.get('lang', None):
-        if ',' in params['lang']:
-            url = url + '?' + '&'.join(
-                ['locale=' + locale for locale in params['lang'].split(',')]
-            )
-        else:
-            url = url + '?locale=' + params['lang']
-    return rest_call(url, method='GET')
+    if status not in (200, 201, 204):
+        raise ZanataRestException(error_msg)
 
+    if status == 201 and op == 'create':
+        return 'Creation successful!'
+    elif status == 200 and op == 'modify':
+        return 'Modification successful!'
 
-def detail(base_url, params):
-    url = base_url + '/projects/p/' + params['project_id']
-    return rest_call(url, method='GET')
+    if body and op == 'config':
+        # the config XML goes into the result verbatim; hand out an
+        # immutable copy rather than the working buffer
+        return bytes(body)
+    elif body:
+        return _loads_raw(body)
+    else:
+        return {}
 
 
-def config(base_url, params):
-    url = base_url + '/project/' + params['project_id'] + \
-          '/version/' + params['version'] + '/config'
-    return rest_call(url, method='GET', op='config')
+# Everything that differs between the operations, as one table:
+# (HTTP method, URL path template, body key map or None, rest_call op tag)
+_OP_SPEC = {
+    'create_project': ('PUT', _DETAIL_PATH, _CREATE_PROJECT_BODY_MAP,
+                       'create'),
+    'modify': ('PUT', _DETAIL_PATH, _CREATE_PROJECT_BODY_MAP, 'modify'),
+    'create_version': ('PUT', _VERSION_PATH, (('id', 'version'),), 'create'),
+    'detail': ('GET', _DETAIL_PATH, None, None),
+    'stats': ('GET', _STATS_PATH, None, None),
+    'config': ('GET', _CONFIG_PATH, None, 'config'),
+}
+
+
+def run_operation(operation, base_url, params):
+    method, path, body_map, op_tag = _OP_SPEC[operation]
+    url = base_url + path.format(**params)
+    if operation == 'stats' and params.get('lang', None):
+        url = ''.join((url, '?', '&'.join(
+            ['locale=%s' % locale for locale in params['lang'].split(',')]
+        )))
+    body = None
+    if body_map:
+        body = dict((body_key, params[param_key])
+                    for body_key, param_key in body_map)
+    return rest_call(url, user=params.get('username'),
+                     token=params.get('token'), data=body,
+                     method=method, op=op_tag)
+
+# Read-only operations that may fan out over several project ids at once
+BATCH_COMMANDS = ('detail', 'stats', 'config')
+
+
+def batch(command, base_url, params):
+    # One thread per project id; the work is pure HTTP wait, so the
+    # requests overlap and the batch finishes in roughly one round-trip.
+    project_ids = [pid.strip() for pid in params['project_id'].split(',')
+                   if pid.strip()]
+    results = {}
+    results_lock = threading.Lock()
+
+    def worker(project_id):
+        op_params = params.copy()
+        op_params['project_id'] = project_id
+        try:
+            server_return = run_operation(command, base_url, op_params)
+        except Exception:
+            e = get_exception()
+            server_return = dict(failed=True, msg=str(e))
+        results_lock.acquire()
+        try:
+            results[project_id] = server_return
+        finally:
+            results_lock.release()
+
+    threads = [threading.Thread(target=worker, args=(pid,))
+               for pid in project_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
 
 
 def prepare_exit_json(command, server_return):
@@ -259,14 +739,15 @@ def prepare_exit_json(command, server_return):
 
 # Some parameters are required depending on the command:
 PARAMS_REQUIRED = dict(
-    create_project=['url', 'project_id', 'project_name', 'username',
-                    'token', 'description', 'type'],
-    create_version=['url', 'project_id', 'version', 'username', 'token'],
-    detail=['url', 'project_id'],
-    modify=['url', 'project_id', 'project_name', 'username', 'token',
-            'description', 'type'],
-    stats=['url', 'project_id', 'version'],
-    config=['url', 'project_id', 'version'],
+    create_project=frozenset(['url', 'project_id', 'project_name',
+                              'username', 'token', 'description', 'type']),
+    create_version=frozenset(['url', 'project_id', 'version',
+                              'username', 'token']),
+    detail=frozenset(['url', 'project_id']),
+    modify=frozenset(['url', 'project_id', 'project_name', 'username',
+                      'token', 'description', 'type']),
+    stats=frozenset(['url', 'project_id', 'version']),
+    config=frozenset(['url', 'project_id', 'version']),
 )
 
 def main():
@@ -288,7 +769,9 @@ def main():
                                           'utf8properties', 'xliff', 'xml'],
                                  default="file"),
             version     =   dict(required=False, aliases=['ver', 'iter']),
-            lang        =   dict(required=False)
+            lang        =   dict(required=False),
+            cache_ttl   =   dict(required=False, type='int', default=0),
+            persistent_pool = dict(required=False, type='bool', default=False)
         ),
         supports_check_mode=False
     )
@@ -296,13 +779,12 @@ def main():
     command = module.params['operation']
 
     # Check for required params
-    missing = []
-    for param in PARAMS_REQUIRED[command]:
-        if not module.params[param]:
-            missing.append(param)
+    supplied = set(k for k, v in module.params.items() if v)
+    missing = PARAMS_REQUIRED[command] - supplied
     if missing:
         module.fail_json(
-            msg="[ %s ] operation requires: %s" % (command, ", ".join(missing))
+            msg="[ %s ] operation requires: %s" % (command,
+                                                   ", ".join(sorted(missing)))
         )
 
     url = module.params['url']
@@ -312,12 +794,13 @@ def main():
 
     # perform operation
     try:
-        this_module = sys.modules[__name__]
-        method = getattr(this_module, command)
-        server_return = method(base_url, module.params)
+        if command in BATCH_COMMANDS and ',' in module.params['project_id']:
+            server_return = batch(command, base_url, module.params)
+        else:
+            server_return = run_operation(command, base_url, module.params)
     except Exception:
         e = get_exception()
-        return module.fail_json(msg=e.message)
+        return module.fail_json(msg=str(e))
 
     # exit with success json
     module.exit_json(**prepare_exit_json(command, server_return))